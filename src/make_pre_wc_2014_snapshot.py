@@ -1,10 +1,15 @@
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 RAW_PATH = Path("data/raw/fifa_rankings_all_years.csv")
 OUT_DIR = Path("data/interim")
 WC_START = pd.Timestamp("2014-06-12")  # World Cup start in Brazil 2014
 
+# Columns needed downstream; rank is nullable because a few recent entries have no rank
+USECOLS = ["rank_date", "rank", "country_full", "total_points"]
+DTYPES = {"rank": "Int32", "country_full": "string", "total_points": "float64"}
+
 def main() -> None:
     """
     Creates a snapshot of the FIFA World Rankings before the 2014 World Cup.
@@ -19,27 +24,39 @@ def main() -> None:
     # 2) Create output directory if necessary
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    # 3) Load CSV file 
-    df = pd.read_csv(RAW_PATH)
+    # 3) Check if required columns exist (header only)
+    header = pd.read_csv(RAW_PATH, nrows=0).columns
+    missing = set(USECOLS) - set(header)
+    if missing:
+        raise ValueError(f"Columns {sorted(missing)} not found. Please check the CSV file.")
 
-    # 4) Check if rank_date column exists
-    if "rank_date" not in df.columns:
-        raise ValueError("Column 'rank_date' not found. Please check the CSV file.")
+    # 4) Load only the needed columns with fixed dtypes, parsing dates while reading
+    df = pd.read_csv(
+        RAW_PATH,
+        usecols=USECOLS,
+        dtype=DTYPES,
+        parse_dates=["rank_date"],
+        date_format="%Y-%m-%d",
+    )
 
-    # 5) Parse dates
-    df["rank_date"] = pd.to_datetime(df["rank_date"], errors="coerce")
+    # 5) Invalid dates leave the column unparsed -> coerce them to NaT
+    if not pd.api.types.is_datetime64_any_dtype(df["rank_date"]):
+        df["rank_date"] = pd.to_datetime(df["rank_date"], errors="coerce")
 
-    # 6) Keep only rankings before World Cup start
-    before_wc = df[df["rank_date"] < WC_START].copy()
-    if before_wc.empty:
+    # 6) Keep only rankings before World Cup start (NaT never matches)
+    dates = df["rank_date"].to_numpy()
+    before_wc = dates < WC_START.to_datetime64()
+    if not before_wc.any():
         raise ValueError("No ranking data found before World Cup start date")
 
     # 7) Find the latest ranking date before the World Cup
-    snapshot_date = before_wc["rank_date"].max()
+    snapshot_date = pd.Timestamp(dates[before_wc].max())
 
-    # 8) Select snapshot for this date
-    snapshot = before_wc[before_wc["rank_date"] == snapshot_date].copy()
-    snapshot = snapshot.sort_values(["rank"], ascending=True)
+    # 8) Select snapshot for this date (works on the date array, no intermediate frame copies)
+    snapshot = df.loc[dates == snapshot_date.to_datetime64()]
+    # Sort by rank directly on the array (missing ranks as NaN go last, like sort_values)
+    ranks = snapshot["rank"].to_numpy(dtype=np.float64, na_value=np.nan)
+    snapshot = snapshot.iloc[np.argsort(ranks, kind="stable")]
 
     # 9) Save snapshot
     out_path = OUT_DIR / f"fifa_rankings_pre_wc_2014_{snapshot_date.date()}.csv"
@@ -1,4 +1,5 @@
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 # Input and output paths
@@ -29,9 +30,9 @@ def main() -> None:
 
     # 5) Normalize ranking points to the interval[0, 1]
     # Strength = (points - min_points) / (max_points - min_points)
-    pts = df["total_points"].astype(float)
-    min_pts = pts.min()
-    max_pts = pts.max()
+    # with a lower bound of 0.05 to avoid zero strength values, computed in one array expression
+    pts = df["total_points"].to_numpy(dtype=np.float64)
+    min_pts, max_pts = pts.min(), pts.max()
 
     if max_pts == min_pts:
         raise ValueError("All teams have identical points. Normalization is not possible")
@@ -40,17 +41,24 @@ def main() -> None:
         "team": df["country_full"],
         "rank": df["rank"].astype(int),
         "points": pts,
-        "strength": (pts - min_pts) / (max_pts - min_pts)
+        "strength": np.maximum(0.05, (pts - min_pts) / (max_pts - min_pts)),
     })
 
-    # Optional lower bound to avoid zero strength values
-    df_out["strength"] = df_out["strength"].clip(lower=0.05)
     # Save processed data
     out_path = OUT_DIR / "teams_strengths_pre_wc_2014.csv"
     df_out.to_csv(out_path, index=False)
+
+    # Parquet sidecar for faster loading in the simulation (needs pyarrow or fastparquet)
+    parquet_path = out_path.with_suffix(".parquet")
+    try:
+        df_out.to_parquet(parquet_path, index=False)
+    except ImportError:
+        parquet_path = None
     # Console output
     print("Team- strengths created successfully!")
     print(f"Saved to: {out_path}")
+    if parquet_path is not None:
+        print(f"Saved to: {parquet_path}")
     print("Top 5 Teams by strength:")
     print(df_out.sort_values("strength", ascending=False).head(5)[["team", "rank", "points", "strength"]])
 
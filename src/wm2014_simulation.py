@@ -3,10 +3,12 @@ FIFA World Cup 2014 Monte Carlo Simulation
 
 """
 
+import argparse
+import csv
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
 # -------------------------
 # SETTINGS 
@@ -14,16 +16,16 @@ import matplotlib.pyplot as plt
 N_SIMULATIONS = 20000
 SEED = 42
 BASE_GOALS = 1.3  # controls typical goal level
+BATCH_SIZE = 50000  # tournaments simulated per vectorized batch (bounds memory use)
+GROUP_TABLE_REPS = 100000  # group simulations per group for the --group-table outcome table
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 DATA_PATH = PROJECT_ROOT / "data" / "processed" / "teams_strengths_pre_wc_2014.csv"
+PARQUET_PATH = DATA_PATH.with_suffix(".parquet")  # optional sidecar written by make_team_strengths.py
 REPORTS_DIR = Path("reports")
 FIGURES_DIR = Path("figures")
-REPORTS_DIR.mkdir(exist_ok=True)
-FIGURES_DIR.mkdir(exist_ok=True)
-
-rng = np.random.default_rng(SEED)
+TOP_N = 15  # teams shown in the bar chart
 
 # -------------------------
 # WORLD CUP 2014 TEAMS
@@ -43,11 +45,39 @@ WC2014_TEAMS = [
 # -------------------------
 # LOAD TEAM STRENGTHS
 # -------------------------
-df = pd.read_csv(DATA_PATH)
+def load_strengths() -> pd.DataFrame:
+    """
+    Loads the team strengths, preferring the Parquet sidecar when it is present and up to date.
+
+    Falls back to the CSV file if the sidecar is missing, older than the CSV file,
+    or no Parquet engine (pyarrow / fastparquet) is installed.
+    """
+    if PARQUET_PATH.exists() and PARQUET_PATH.stat().st_mtime >= DATA_PATH.stat().st_mtime:
+        try:
+            return pd.read_parquet(PARQUET_PATH)
+        except ImportError:
+            pass
+    return pd.read_csv(DATA_PATH)
+
+df = load_strengths()
 if not {"team", "strength"}.issubset(df.columns):
     raise ValueError("Expected columns in teams file: team, strength")
 
-STRENGTH = dict(zip(df["team"], df["strength"]))
+missing_teams = set(WC2014_TEAMS) - set(df["team"])
+if missing_teams:
+    raise ValueError(f"No strength found for teams: {sorted(missing_teams)}")
+
+# team index = position in WC2014_TEAMS, STRENGTH[i] is the strength of team i.
+# The simulation works on these indices only, names come back at reporting.
+TEAM_IDX = {team: i for i, team in enumerate(WC2014_TEAMS)}
+TEAM_NAMES = np.array(WC2014_TEAMS)
+STRENGTH = np.ascontiguousarray(
+    df.set_index("team")["strength"].reindex(WC2014_TEAMS), dtype=np.float64
+)
+
+# make_team_strengths.py clips strengths to >= 0.05, so every pairing has a positive denominator
+if not (STRENGTH > 0).all():
+    raise ValueError("Team strengths must be positive")
 
 # -------------------------
 # WC 2014 STRUCTURE
@@ -70,231 +100,494 @@ ROUND_OF_16 = [
     ("F1", "E2"), ("H1", "G2"),
 ]
 
+# team indices per group, shape (8, 4)
+GROUP_TEAMS = np.array([[TEAM_IDX[t] for t in teams] for teams in GROUPS.values()], dtype=np.int32)
+
+# the 6 matches of a group: every team plays every other team once
+PAIRS = np.array([[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]])
+
+# (6, 4) incidence tables: row k marks the first / second team of match k,
+# so per-match results sum up into the group table with one matrix product
+FIRST_OF = np.eye(4, dtype=int)[PAIRS[:, 0]]
+SECOND_OF = np.eye(4, dtype=int)[PAIRS[:, 1]]
+
+# POS_IN_GROUP[i]: position (0-3) of team i inside its group
+POS_IN_GROUP = np.empty(len(WC2014_TEAMS), dtype=np.int32)
+POS_IN_GROUP[GROUP_TEAMS] = np.arange(4)
+
+# slot positions in the (N, 16) array of group qualifiers: A1, A2, B1, B2, ...
+SLOT_POS = {f"{g}{place}": 2 * k + place - 1 for k, g in enumerate(GROUPS) for place in (1, 2)}
+# knockout bracket as a flat list of 16 slots: neighbours meet in the Round of 16
+# and the winners of neighbouring matches meet again in every following round
+R16_SLOTS = np.array([SLOT_POS[slot] for match in ROUND_OF_16 for slot in match], dtype=np.int32)
+
+# -------------------------
+# MATCH TABLES
+# -------------------------
+# Strengths are fixed for all simulations, so the expected goals and the
+# penalty win probability of every pairing are computed once up front.
+_s = STRENGTH[:, None]
+SHARE = _s / (_s + _s.T)  # simple strength share of row team vs column team
+
+# LAM[a, b]: expected goals of team a against team b
+LAM = np.maximum(0.05, BASE_GOALS * SHARE).astype(np.float32)
+
+# PEN_PA[a, b]: P(team a wins a penalty shootout against team b), strength-weighted
+PEN_PA = SHARE
+
+# LAM_PAIR[a, b] = (LAM[a, b], LAM[b, a]): both sides of a match in one lookup
+LAM_PAIR = np.ascontiguousarray(np.stack([LAM, LAM.T], axis=-1))
+
+# Poisson CDF of every entry of LAM_PAIR for inverse transform sampling.
+# GOALS_CDF[k, cell] = P(goals <= k), cell = flat index into LAM_PAIR.
+# Draws above the last entry count as MAX_GOALS goals. For lambda <= BASE_GOALS (1.3)
+# that tail P(goals >= MAX_GOALS) is < 1.5e-8, and the float32 storage rounds the CDF
+# by about 6e-8, so together they stay below GOALS_TAIL_TOL (checked below).
+MAX_GOALS = 12
+GOALS_TAIL_TOL = 1e-7
+_k = np.arange(MAX_GOALS)
+_lam = LAM_PAIR.astype(np.float64).reshape(-1, 1)
+_factorial = np.cumprod(np.maximum(_k, 1))
+_cdf = np.cumsum(np.exp(-_lam) * _lam**_k / _factorial, axis=1)
+GOALS_CDF = np.ascontiguousarray(_cdf.T, dtype=np.float32)
+
+# a larger BASE_GOALS would need a larger MAX_GOALS
+if (1.0 - GOALS_CDF[-1].astype(np.float64)).max() > GOALS_TAIL_TOL:
+    raise ValueError(f"MAX_GOALS={MAX_GOALS} is too small for the expected goals, increase it")
+
 # -------------------------
 # MATCH MODEL (Poisson goals)
 # -------------------------
-def simulate_match(team_a: str, team_b: str) -> tuple[int, int]:
+def simulate_matches(team_a: np.ndarray, team_b: np.ndarray, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
     """
-    Simulates a single football match between two teams.
+    Simulates a batch of football matches at once.
 
-    The number of goals for each team is generated using a Possion distribution.
-    The expected goals depend on the realative team strengths derived from FIFA rankings.
+    The number of goals for each team is generated using a Poisson distribution,
+    sampled by inverse transform from the precomputed GOALS_CDF table.
+    The expected goals depend on the relative team strengths derived from FIFA rankings.
 
     Parameters:
-    team_a : str
-        Name of the first team
-    team_b : str
-        Name of the second team
+    team_a : np.ndarray
+        Team indices of the first teams (any shape)
+    team_b : np.ndarray
+        Team indices of the second teams (same shape as team_a)
+    rng : np.random.Generator
+        Random number generator
 
     Returns:
-    ga : int
-        Goals scored by team A
-    gb: int
-        Goals scored by team B
+    ga : np.ndarray
+        Goals scored by the teams in team_a
+    gb: np.ndarray
+        Goals scored by the teams in team_b
     """
-    sa = float(STRENGTH[team_a])
-    sb = float(STRENGTH[team_b])
-
-    # simple strength share
-    denom = sa + sb + 1e-12
-    share_a = sa / denom
-    share_b = sb / denom
-
-    lam_a = max(0.05, BASE_GOALS * share_a)
-    lam_b = max(0.05, BASE_GOALS * share_b)
-
-    ga = int(rng.poisson(lam_a))
-    gb = int(rng.poisson(lam_b))
-    return ga, gb
-
-def knockout_winner(team_a: str, team_b: str) -> str:
+    # table cells of both sides of every match, (a, b, 0) and (a, b, 1) in LAM_PAIR
+    cell = ((team_a * LAM_PAIR.shape[1] + team_b) * 2)[..., None] + np.arange(2, dtype=np.int32)
+    cell = cell.ravel()
+
+    # inverse transform: goals = number of k with P(goals <= k) <= u.
+    # Only draws that are still above the CDF are checked for the next goal,
+    # and most matches stop after 0 or 1 goals.
+    u = rng.random(cell.size, dtype=np.float32)
+    goals = (u >= GOALS_CDF[0][cell]).astype(np.int8)
+    active = np.flatnonzero(goals)
+    for cdf_k in GOALS_CDF[1:]:
+        active = active[u[active] >= cdf_k[cell[active]]]
+        if active.size == 0:
+            break
+        goals[active] += 1
+
+    goals = goals.reshape(*np.shape(team_a), 2)
+    return goals[..., 0], goals[..., 1]
+
+def knockout_winners(team_a: np.ndarray, team_b: np.ndarray, rng: np.random.Generator) -> np.ndarray:
     """
-    Determines the winner of a knockout match between two teams.
+    Determines the winners of a batch of knockout matches.
 
-    If the match ends in a draw, the winner is decided by a strength-weight penalty 
+    If a match ends in a draw, the winner is decided by a strength-weight penalty 
     shootout.
 
     Parameters:
-    team_a: str
-        Name of the first team.
-    team_b: str
-        Name of the second team.
+    team_a: np.ndarray
+        Team indices of the first teams.
+    team_b: np.ndarray
+        Team indices of the second teams (same shape as team_a).
+    rng: np.random.Generator
+        Random number generator.
 
     Returns:
-    winner: str
-        Name of the winning team
+    winners: np.ndarray
+        Team indices of the winning teams
     """
-    ga, gb = simulate_match(team_a, team_b)
-
-    if ga > gb:
-        return team_a
-    if gb > ga:
-        return team_b
+    ga, gb = simulate_matches(team_a, team_b, rng)
 
     # draw -> penalties 
-    sa = float(STRENGTH[team_a])
-    sb = float(STRENGTH[team_b])
-    p_a = sa / (sa + sb + 1e-12)
-    return team_a if rng.random() < p_a else team_b
+    penalties_a = rng.random(team_a.shape) < PEN_PA[team_a, team_b]
+
+    a_wins = (ga > gb) | ((ga == gb) & penalties_a)
+    return np.where(a_wins, team_a, team_b)
 
 # -------------------------
 # GROUP STAGE
 # -------------------------
-def simulate_group(teams: list[str]) -> tuple[str, str]:
+def simulate_groups(n: int, rng: np.random.Generator) -> np.ndarray:
     """
-    Simulates the group stage for a group of four teams.
+    Simulates the group stage of n tournaments at once.
 
-    Each team plays against every other team once.
+    Each team plays against every other team of its group once.
     Teams are ranked by points, then goal difference.
     Remaining ties are broken randomly.
 
     Parameters:
-    teams: list of str
-        List of four team names in the group.
+    n: int
+        Number of tournaments.
+    rng: np.random.Generator
+        Random number generator.
 
     Returns:
-    winner: str
-        Group winnner.
-    runner_up : str
-        Second place of the group
+    qualified: np.ndarray
+        Team indices of shape (n, 16) in slot order A1, A2, B1, B2, ...
     """
+    teams = np.broadcast_to(GROUP_TEAMS, (n, *GROUP_TEAMS.shape))
+
+    # all group matches of all tournaments, shape (n, 8, 6)
+    ga, gb = simulate_matches(teams[..., PAIRS[:, 0]], teams[..., PAIRS[:, 1]], rng)
+
     # table: points and goal difference only 
-    table = {t: {"pts": 0, "gd": 0} for t in teams}
-
-    for i in range(len(teams)):
-        for j in range(i + 1, len(teams)):
-            a, b = teams[i], teams[j]
-            ga, gb = simulate_match(a, b)
-
-            table[a]["gd"] += ga - gb
-            table[b]["gd"] += gb - ga
-
-            if ga > gb:
-                table[a]["pts"] += 3
-            elif gb > ga:
-                table[b]["pts"] += 3
-            else:
-                table[a]["pts"] += 1
-                table[b]["pts"] += 1
-
-    # sort by pts, gd, then random to break full ties
-    ranking = sorted(
-        teams,
-        key=lambda t: (table[t]["pts"], table[t]["gd"], rng.random()),
-        reverse=True,
-    )
-    return ranking[0], ranking[1]
+    draw = ga == gb
+    pts_a = np.where(ga > gb, 3, draw)
+    pts_b = np.where(gb > ga, 3, draw)
+
+    pts = pts_a @ FIRST_OF + pts_b @ SECOND_OF
+    gd = (ga - gb) @ (FIRST_OF - SECOND_OF)
+
+    # sort by pts, gd, then random to break full ties, packed into one sort key
+    score = pts * 1e9 + gd * 1e4 + rng.random(teams.shape)
+    # only the top 2 are needed: partitioning around position 1 puts the best team at 0
+    # and the second best at 1 without fully sorting each group
+    top2 = np.argpartition(-score, 1, axis=-1)[..., :2]
+
+    qualified = np.take_along_axis(teams, top2, axis=-1)
+    return qualified.reshape(n, -1)
+
+def group_outcome_cdf(reps: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Estimates the distribution of (winner, runner-up) for every group.
+
+    The strengths are fixed, so each group's outcome is the same categorical
+    distribution in every tournament. It is estimated once from reps group
+    simulations and can then be sampled directly instead of playing 6 matches.
+
+    Parameters:
+    reps: int
+        Number of simulations per group used for the estimate.
+    rng: np.random.Generator
+        Random number generator.
+
+    Returns:
+    cdf: np.ndarray
+        Cumulative probabilities of shape (8, 16); outcome k = 4 * winner + runner_up
+        with positions inside the group (the 4 cells winner == runner_up stay empty).
+    """
+    n_groups = len(GROUP_TEAMS)
+    counts = np.zeros(n_groups * 16, dtype=np.int64)
+
+    for start in range(0, reps, BATCH_SIZE):
+        qualified = simulate_groups(min(BATCH_SIZE, reps - start), rng).reshape(-1, n_groups, 2)
+        pos = POS_IN_GROUP[qualified]
+        outcome = np.arange(n_groups) * 16 + pos[..., 0] * 4 + pos[..., 1]
+        counts += np.bincount(outcome.ravel(), minlength=n_groups * 16)
+
+    cdf = np.cumsum(counts.reshape(n_groups, 16), axis=1) / reps
+    cdf[:, -1] = 1.0  # guard against rounding, every u < 1 must find an outcome
+    return cdf
+
+def sample_groups(n: int, cdf: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draws the group stage of n tournaments from precomputed outcome distributions.
+
+    Parameters:
+    n: int
+        Number of tournaments.
+    cdf: np.ndarray
+        Outcome distributions from group_outcome_cdf, shape (8, 16).
+    rng: np.random.Generator
+        Random number generator.
+
+    Returns:
+    qualified: np.ndarray
+        Team indices of shape (n, 16) in slot order A1, A2, B1, B2, ...
+    """
+    # inverse transform sampling: one uniform number per group and tournament
+    u = rng.random((n, len(cdf)))
+    outcome = (cdf <= u[..., None]).sum(axis=-1)
+
+    groups = np.arange(len(cdf))
+    winner = GROUP_TEAMS[groups, outcome // 4]
+    runner_up = GROUP_TEAMS[groups, outcome % 4]
+    return np.stack([winner, runner_up], axis=-1).reshape(n, -1)
 
 # -------------------------
 # TOURNAMENT 
 # -------------------------
-def simulate_world_cup_2014() -> tuple[str, str]:
+def simulate_world_cup_2014(
+    n: int, rng: np.random.Generator, group_cdf: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
     """ 
-    Simulates one complete FIFA World Cup 2014 tournament.
+    Simulates n complete FIFA World Cup 2014 tournaments at once.
 
     The simulation includes the group stage and all knockout rounds.
     Group winners and runner-up advance according to the official tournement bracket.
 
+    Parameters:
+    n: int
+        Number of tournaments.
+    rng: np.random.Generator
+        Random number generator.
+    group_cdf: np.ndarray or None
+        Optional group outcome distributions (see group_outcome_cdf). If given,
+        group results are sampled from them instead of simulating the matches.
+
     Returns
 
-    champion: str
-        World Cup winner.
-    runner_up : str
-        Losing finalist
+    champion: np.ndarray
+        Team indices of the World Cup winners, shape (n,).
+    runner_up : np.ndarray
+        Team indices of the losing finalists, shape (n,).
     """
-    slots = {}
-
-    # group stage -> slots A1, A2, ...
-    for g, teams in GROUPS.items():
-        w, r = simulate_group(teams)
-        slots[f"{g}1"] = w
-        slots[f"{g}2"] = r
-
-    # Round of 16 winners
-    winners = []
-    for a_slot, b_slot in ROUND_OF_16:
-        winners.append(knockout_winner(slots[a_slot], slots[b_slot]))
-
-    # Quarterfinals -> Semifinals -> Final
-    while len(winners) > 2:
-        winners = [knockout_winner(winners[i], winners[i + 1]) for i in range(0, len(winners), 2)]
-
-    finalist1, finalist2 = winners[0], winners[1]
-    champion = knockout_winner(finalist1, finalist2)
-    runner_up = finalist2 if champion == finalist1 else finalist1
+    qualified = simulate_groups(n, rng) if group_cdf is None else sample_groups(n, group_cdf, rng)
+
+    bracket = np.take(qualified, R16_SLOTS, axis=1)
+
+    # Round of 16 -> Quarterfinals -> Semifinals -> Final, one batched call per round
+    while bracket.shape[1] > 1:
+        pairs = bracket.reshape(n, -1, 2)
+        bracket = knockout_winners(pairs[..., 0], pairs[..., 1], rng)
+
+    champion = bracket[:, 0]
+    finalist1, finalist2 = pairs[:, 0, 0], pairs[:, 0, 1]
+    runner_up = np.where(champion == finalist1, finalist2, finalist1)
     return champion, runner_up
 
-# -------------------------
-# MONTE CARLO LOOP
-# -------------------------
-champions = []
-finalists = []
+def run_simulations(
+    n: int, rng: np.random.Generator, group_cdf: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Runs n tournaments in batches of at most BATCH_SIZE.
 
-for _ in range(N_SIMULATIONS):
-    champ, runner_up = simulate_world_cup_2014()
-    champions.append(champ)
-    finalists.append(champ)
-    finalists.append(runner_up)
+    Results are written into preallocated int16 arrays of team indices, so memory
+    stays bounded for large n and no per-tournament Python objects are created.
 
-# -------------------------
-# RESULTS 
-# -------------------------
+    Parameters:
+    n: int
+        Number of tournaments.
+    rng: np.random.Generator
+        Random number generator.
+    group_cdf: np.ndarray or None
+        Optional group outcome distributions, passed on to simulate_world_cup_2014.
 
-champ_series = pd.Series(champions)
+    Returns:
+    champions: np.ndarray
+        Team indices of the World Cup winners, shape (n,).
+    runners_up: np.ndarray
+        Team indices of the losing finalists, shape (n,).
+    """
+    champions = np.empty(n, dtype=np.int16)
+    runners_up = np.empty(n, dtype=np.int16)
 
-# Probability of winning the title 
-p_title = champ_series.value_counts(normalize=True)
+    for start in range(0, n, BATCH_SIZE):
+        stop = min(start + BATCH_SIZE, n)
+        champions[start:stop], runners_up[start:stop] = simulate_world_cup_2014(stop - start, rng, group_cdf)
 
-result = pd.DataFrame({
-    "team": sorted(set(STRENGTH.keys()))
-})
-result["p_title"] = result["team"].map(p_title).fillna(0.0)
+    return champions, runners_up
 
-result = result[result["team"].isin(WC2014_TEAMS)]
-result = result.sort_values("p_title", ascending=False)
+def run_batch(
+    seed_seq: np.random.SeedSequence, n: int, group_cdf: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Runs n tournaments with an own random number stream (one batch per worker process).
 
+    Parameters:
+    seed_seq: np.random.SeedSequence
+        Seed of this batch, spawned from the main SEED so that batches are independent.
+    n: int
+        Number of tournaments.
+    group_cdf: np.ndarray or None
+        Optional group outcome distributions, passed on to simulate_world_cup_2014.
 
-# save CSV
-out_csv = REPORTS_DIR / "wm2014_title_probabilities.csv"
-result.to_csv(out_csv, index=False)
+    Returns:
+    champions: np.ndarray
+        Team indices of the World Cup winners, shape (n,).
+    runners_up: np.ndarray
+        Team indices of the losing finalists, shape (n,).
+    """
+    return run_simulations(n, np.random.default_rng(seed_seq), group_cdf)
 
-# short summary text
-summary = (
-    "WM 2014 Monte Carlo Simulation (student version)\n"
-    f"N simulations: {N_SIMULATIONS}\n"
-    f"Seed: {SEED}\n"
-    f"BASE_GOALS: {BASE_GOALS}\n"
-    "Output:\n"
-    "- reports/wm2014_title_probabilities.csv\n"
-    "- figures/wm2014_title_probabilities.png\n"
-    "\nModel notes:\n"
-    "- Group tie-break simplified: points, goal difference, then random.\n"
-    "- Knockout draws resolved by strength-weighted penalties.\n"
-)
-(REPORTS_DIR / "wm2014_summary.txt").write_text(summary, encoding="utf-8")
+def run_parallel(
+    n: int, workers: int, seed_seq: np.random.SeedSequence, group_cdf: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Splits n tournaments over worker processes and concatenates their results.
+
+    Every worker gets its own child of seed_seq, so results are reproducible
+    for a fixed number of workers.
+
+    Parameters:
+    n: int
+        Number of tournaments.
+    workers: int
+        Number of worker processes (1 runs in the current process).
+    seed_seq: np.random.SeedSequence
+        Seed the worker streams are spawned from.
+    group_cdf: np.ndarray or None
+        Optional group outcome distributions, passed on to every worker.
+
+    Returns:
+    champions: np.ndarray
+        Team indices of the World Cup winners, shape (n,).
+    runners_up: np.ndarray
+        Team indices of the losing finalists, shape (n,).
+    """
+    seed_seqs = seed_seq.spawn(workers)
+    sizes = [n // workers + (i < n % workers) for i in range(workers)]
+
+    if workers == 1:
+        return run_batch(seed_seqs[0], n, group_cdf)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run_batch, seed_seqs, sizes, [group_cdf] * workers))
+
+    champions = np.concatenate([c for c, _ in results])
+    runners_up = np.concatenate([r for _, r in results])
+    return champions, runners_up
 
 # -------------------------
 # PLOT 
 # -------------------------
-TOP_N = 15
-top = result.head(TOP_N).copy()
+def plot_title_probabilities(result: pd.DataFrame, fig_path: Path, dpi: int) -> None:
+    """
+    Draws a bar chart of the title probabilities of the top teams.
+
+    matplotlib is only imported here and uses the non-interactive Agg backend,
+    so runs without --plot never pay for it.
 
-plt.figure(figsize=(12, 6))
-x = np.arange(len(top))
+    Parameters:
+    result: pd.DataFrame
+        Title probabilities (columns team, p_title), sorted descending.
+    fig_path: Path
+        Output path of the PNG file.
+    dpi: int
+        Resolution of the saved figure.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
 
-plt.bar(x, top["p_title"], color="orange", label="Win Title (P)")
-plt.xticks(x, top["team"], rotation=45, ha="right")
-plt.ylabel("Probability")
-plt.title("World Cup 2014 Monte Carlo: Probability to Win the Title (Top Teams)")
-plt.legend()
-plt.tight_layout()
+    top = result.head(TOP_N)
+
+    plt.figure(figsize=(12, 6))
+    x = np.arange(len(top))
+
+    plt.bar(x, top["p_title"], color="orange", label="Win Title (P)")
+    plt.xticks(x, top["team"], rotation=45, ha="right")
+    plt.ylabel("Probability")
+    plt.title("World Cup 2014 Monte Carlo: Probability to Win the Title (Top Teams)")
+    plt.legend()
+    plt.tight_layout()
+
+    plt.savefig(fig_path, dpi=dpi)
+    plt.close()
+
+def parse_args() -> argparse.Namespace:
+    """
+    Reads the command line options of the simulation.
+    """
+    parser = argparse.ArgumentParser(description="FIFA World Cup 2014 Monte Carlo simulation")
+    parser.add_argument("--simulations", type=int, default=N_SIMULATIONS, help=f"number of simulated tournaments (default: {N_SIMULATIONS})")
+    parser.add_argument(
+        "--group-table",
+        action="store_true",
+        help=f"sample group results from an outcome table estimated once from {GROUP_TABLE_REPS} group simulations (pays off for large --simulations)",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes (default: 1)")
+    parser.add_argument("--plot", action="store_true", help="also save the title probability bar chart")
+    parser.add_argument("--dpi", type=int, default=100, help="resolution of the bar chart (default: 100)")
+    args = parser.parse_args()
+
+    if args.simulations < 1:
+        parser.error("--simulations must be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+def main() -> None:
+    """
+    Runs the Monte Carlo simulation and writes the result table, the summary and optionally the plot.
+    """
+    args = parse_args()
+    REPORTS_DIR.mkdir(exist_ok=True)
+
+    # -------------------------
+    # MONTE CARLO
+    # -------------------------
+    # independent streams for the group table and the tournaments, both derived from SEED
+    table_seq, run_seq = np.random.SeedSequence(SEED).spawn(2)
+
+    group_cdf = None
+    if args.group_table:
+        group_cdf = group_outcome_cdf(GROUP_TABLE_REPS, np.random.default_rng(table_seq))
+
+    champions, runners_up = run_parallel(args.simulations, args.workers, run_seq, group_cdf)
+
+    # -------------------------
+    # RESULTS 
+    # -------------------------
+
+    # Probability of winning the title, indexed by team index
+    p_title = np.bincount(champions, minlength=len(WC2014_TEAMS)) / args.simulations
+
+    # highest probability first, ties in alphabetical order
+    order = np.lexsort((TEAM_NAMES, -p_title))
+    result = pd.DataFrame({
+        "team": TEAM_NAMES[order],
+        "p_title": p_title[order],
+    })
+
+    # save CSV
+    out_csv = REPORTS_DIR / "wm2014_title_probabilities.csv"
+    # (plain csv writer, 32 rows do not need the pandas CSV engine)
+    with out_csv.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["team", "p_title"])
+        writer.writerows(zip(result["team"], result["p_title"].tolist()))
+
+    fig_path = FIGURES_DIR / "wm2014_title_probabilities.png"
+    outputs = [out_csv] + ([fig_path] if args.plot else [])
+
+    # short summary text
+    summary = (
+        "WM 2014 Monte Carlo Simulation (student version)\n"
+        f"N simulations: {args.simulations}\n"
+        f"Seed: {SEED}\n"
+        f"Workers: {args.workers}\n"
+        f"BASE_GOALS: {BASE_GOALS}\n"
+        "Output:\n"
+        + "".join(f"- {path.as_posix()}\n" for path in outputs)
+        + "\nModel notes:\n"
+        "- Group tie-break simplified: points, goal difference, then random.\n"
+        "- Knockout draws resolved by strength-weighted penalties.\n"
+        f"- Poisson goals capped at {MAX_GOALS} per team and match.\n"
+        + (f"- Group results sampled from outcome tables ({GROUP_TABLE_REPS} simulations per group).\n" if args.group_table else "")
+    )
+    (REPORTS_DIR / "wm2014_summary.txt").write_text(summary, encoding="utf-8")
 
-fig_path = FIGURES_DIR / "wm2014_title_probabilities.png"
-plt.savefig(fig_path, dpi=200)
-plt.close()
+    if args.plot:
+        FIGURES_DIR.mkdir(exist_ok=True)
+        plot_title_probabilities(result, fig_path, args.dpi)
 
-print(" Done.")
-print(f"Saved: {out_csv}")
-print(f"Saved: {fig_path}")
-print(result.to_string(index=False))
+    print(" Done.")
+    for path in outputs:
+        print(f"Saved: {path}")
+    print(result.to_string(index=False))
 
+if __name__ == "__main__":
+    main()